@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark for response serialization
+
+Drives the real app (routes, response_model handling and compression
+middleware) through FastAPI's TestClient, once with FAST_SERIALIZATION=true
+and once with false, and reports request time plus the response body size
+and Content-Encoding actually sent, for typical and large responses.
+Compression follows the COMPRESSION setting, e.g.
+    COMPRESSION=gzip python benchmark_serialization.py
+
+The AI model is replaced with a canned response so only our own request
+handling is measured - no API key or network access is needed:
+    python benchmark_serialization.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+ITERATIONS = 200
+ACCEPT_ENCODING = "br, gzip"
+
+
+class CannedResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class CannedModel:
+    """Stands in for the Gemini model and returns a fixed response"""
+
+    text = ""
+
+    def generate_content(self, prompt):
+        return CannedResponse(self.text)
+
+    async def generate_content_async(self, prompt):
+        return CannedResponse(self.text)
+
+
+def grammar_case(count):
+    suggestions = [
+        {
+            "original_text": f"This are sentence number {i}",
+            "corrected_text": f"This is sentence number {i}",
+            "explanation": "Subject-verb agreement: 'this' takes the singular verb 'is'.",
+            "confidence": 0.95
+        }
+        for i in range(count)
+    ]
+    model_text = json.dumps({"suggestions": suggestions, "has_errors": bool(suggestions)})
+    payload = {"text": "This are a test sentence.", "feature": "grammar_check"}
+    return "/check-grammar", payload, model_text
+
+
+def summarize_case(text_length, echo_text=True):
+    text = ("Artificial intelligence is intelligence demonstrated by machines. " * (text_length // 66 + 1))[:text_length]
+    payload = {"text": text, "action": "summarize", "echo_text": echo_text}
+    return "/text-insights", payload, text[: max(text_length // 10, 80)]
+
+
+CASES = [
+    ("grammar, 3 suggestions", grammar_case(3)),
+    ("grammar, 100 suggestions", grammar_case(100)),
+    ("summarize 2KB, echo", summarize_case(2_000)),
+    ("summarize 2KB, no echo", summarize_case(2_000, echo_text=False)),
+    ("summarize 100KB, echo", summarize_case(100_000)),
+    ("summarize 100KB, no echo", summarize_case(100_000, echo_text=False)),
+]
+
+
+def run_cases():
+    """Child process: measure every case against the app as configured by the environment"""
+    os.environ.setdefault("GEMINI_API_KEY", "benchmark")  # The canned model never calls the API
+
+    from fastapi.testclient import TestClient
+    import main
+    from routes import grammar, text_insights
+
+    model = CannedModel()
+    grammar.get_ai_model = lambda: model
+    text_insights.get_ai_model = lambda: model
+    client = TestClient(main.app)
+
+    results = []
+    for name, (path, payload, model_text) in CASES:
+        model.text = model_text
+        with contextlib.redirect_stdout(io.StringIO()):  # Routes print every request
+            response = client.post(path, json=payload, headers={"Accept-Encoding": ACCEPT_ENCODING})
+            response.raise_for_status()
+
+            start = time.perf_counter()
+            for _ in range(ITERATIONS):
+                client.post(path, json=payload, headers={"Accept-Encoding": ACCEPT_ENCODING})
+            elapsed = time.perf_counter() - start
+
+        results.append({
+            "name": name,
+            "request_us": elapsed / ITERATIONS * 1e6,
+            "body_bytes": len(response.content),
+            "wire_bytes": int(response.headers.get("content-length", len(response.content))),
+            "encoding": response.headers.get("content-encoding", "identity"),
+        })
+    print(json.dumps(results))
+
+
+def measure(fast):
+    env = {**os.environ, "FAST_SERIALIZATION": "true" if fast else "false"}
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--run-cases"],
+        env=env, capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    print("📊 Serialization benchmark (TestClient, real app and middleware)")
+    print(f"   {ITERATIONS} requests per case, Accept-Encoding: {ACCEPT_ENCODING}")
+    print("=" * 110)
+
+    default_results = measure(fast=False)
+    fast_results = measure(fast=True)
+
+    for default, fast in zip(default_results, fast_results):
+        print(f"{default['name']:<26} "
+              f"default={default['request_us']:8.1f}µs  fast={fast['request_us']:8.1f}µs  "
+              f"({default['request_us'] / fast['request_us']:4.2f}x)  "
+              f"body={fast['body_bytes']:,}B  wire={fast['wire_bytes']:,}B ({fast['encoding']})"
+              + ("" if default["body_bytes"] == fast["body_bytes"] else f"  [default body={default['body_bytes']:,}B]"))
+
+
+if __name__ == "__main__":
+    if "--run-cases" in sys.argv:
+        run_cases()
+    else:
+        main()
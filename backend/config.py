@@ -27,4 +27,24 @@ CORS_CONFIG = {
     "allow_credentials": True,
     "allow_methods": ["*"],
     "allow_headers": ["*"],
-} 
\ No newline at end of file
+}
+
+# Response serialization
+# FAST_SERIALIZATION: build responses without re-validating them and serialize with pydantic-core
+# COMPRESSION: "off", "gzip" or "br" (needs brotli-asgi) - off by default since the
+# extension talks to a local backend, where compressing only costs CPU
+# COMPRESSION_MIN_SIZE: responses smaller than this (bytes) are sent uncompressed
+FAST_SERIALIZATION = os.getenv("FAST_SERIALIZATION", "true").lower() == "true"
+COMPRESSION = os.getenv("COMPRESSION", "off").lower()
+if COMPRESSION not in ("off", "gzip", "br"):
+    raise ValueError("COMPRESSION must be one of: off, gzip, br")
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+# Speculative prefetch (Smart Text Assistant requests sent with priority="low")
+# PREFETCH_TTL: seconds a finished prefetch result is kept after it was last used, for normal requests to claim
+# PREFETCH_MAX_CONCURRENT: low-priority generations allowed at once; extra prefetches are rejected,
+#   as are all new prefetches while a normal request is generating
+# PREFETCH_MAX_ENTRIES: finished prefetch results kept at most (oldest dropped first)
+PREFETCH_TTL = int(os.getenv("PREFETCH_TTL", "120"))
+PREFETCH_MAX_CONCURRENT = int(os.getenv("PREFETCH_MAX_CONCURRENT", "2"))
+PREFETCH_MAX_ENTRIES = int(os.getenv("PREFETCH_MAX_ENTRIES", "100"))
@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from config import CORS_CONFIG
+from config import CORS_CONFIG, COMPRESSION, COMPRESSION_MIN_SIZE
+from serialization import add_compression
 from routes import general, grammar, text_insights
 
 # Initialize FastAPI app
@@ -13,6 +14,9 @@ app = FastAPI(
 # Configure CORS for Chrome extension
 app.add_middleware(CORSMiddleware, **CORS_CONFIG)
 
+# Optionally compress large responses (e.g. long summaries and suggestion lists)
+add_compression(app, COMPRESSION, minimum_size=COMPRESSION_MIN_SIZE)
+
 # Include routers
 app.include_router(general.router, tags=["general"])
 app.include_router(grammar.router, tags=["grammar"])
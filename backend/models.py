@@ -25,10 +25,12 @@ class TextInsightRequest(BaseModel):
     text: str
     action: str  # "explain", "summarize", "custom"
     custom_prompt: Optional[str] = None  # Required when action is "custom"
+    echo_text: bool = True  # Set False to omit original_text from the response
+    priority: str = "normal"  # "low" for speculative prefetches
 
 
 class TextInsightResponse(BaseModel):
-    original_text: str
+    original_text: Optional[str] = None  # None when the request set echo_text=False
     action: str
     result: str
     custom_prompt: Optional[str] = None
@@ -0,0 +1,164 @@
+import asyncio
+import hashlib
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from fastapi import HTTPException, Request
+
+from config import PREFETCH_TTL, PREFETCH_MAX_CONCURRENT, PREFETCH_MAX_ENTRIES
+
+# How often a waiting prefetch checks whether its client went away
+DISCONNECT_POLL_INTERVAL = 0.5
+
+
+def prefetch_key(action: str, text: str, custom_prompt: Optional[str] = None) -> str:
+    """Key identifying a Smart Text Assistant generation"""
+    raw = f"{action}\x00{custom_prompt or ''}\x00{text}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class Prefetch:
+    """A running or finished prefetch and the number of low-priority requests waiting on it"""
+
+    def __init__(self, task: asyncio.Task, expires: float):
+        self.task = task
+        self.expires = expires
+        self.waiters = 0
+        self.used = False  # Delivered to a prefetch client or claimed by a normal request
+
+
+class PrefetchStore:
+    """Speculative generations kept ready for the real request.
+
+    Low-priority requests for the same key share one task. A finished result
+    stays in the store for `ttl` seconds after it was last used, so the real
+    request - from this tab or another - can claim it. A running task is
+    cancelled only when every waiting client has disconnected and no normal
+    request has claimed it. New prefetches are rejected while normal requests
+    are generating, so they never compete with them.
+    """
+
+    def __init__(self, ttl: int, max_concurrent: int, max_entries: int):
+        self.ttl = ttl
+        self.max_concurrent = max_concurrent
+        self.max_entries = max_entries
+        self._entries = {}  # key -> Prefetch, oldest first
+        self._normal_running = 0
+        self.stats = {
+            "issued": 0, "delivered": 0, "claimed": 0, "cancelled": 0,
+            "rejected": 0, "failed": 0, "expired": 0
+        }
+
+    def _running(self) -> int:
+        return sum(1 for entry in self._entries.values() if not entry.task.done())
+
+    def _prune(self):
+        # Only finished results nobody is waiting on can expire or be evicted
+        idle = [key for key, entry in self._entries.items() if entry.waiters == 0 and entry.task.done()]
+        now = time.monotonic()
+        for key in idle:
+            if self._entries[key].expires <= now:
+                self._drop(key)
+
+        # Drop the oldest idle results when over the size limit
+        for key in idle:
+            if len(self._entries) <= self.max_entries:
+                break
+            if key in self._entries:
+                self._drop(key)
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key)
+        if not entry.task.done():
+            entry.task.cancel()
+            self.stats["cancelled"] += 1
+        elif not entry.used:
+            # Generated but never delivered or claimed - upstream cost spent for nothing
+            self.stats["expired"] += 1
+
+    @contextmanager
+    def normal_generation(self):
+        """Mark a normal-priority generation as running while the block executes"""
+        self._normal_running += 1
+        try:
+            yield
+        finally:
+            self._normal_running -= 1
+
+    def start(self, key: str, generate) -> Optional[Prefetch]:
+        """Start (or join) a prefetch; returns None when it has to yield to normal requests or capacity is used up"""
+        self._prune()
+        entry = self._entries.get(key)
+        if entry is None:
+            if self._normal_running > 0 or self._running() >= self.max_concurrent:
+                self.stats["rejected"] += 1
+                return None
+
+            entry = Prefetch(asyncio.create_task(generate()), time.monotonic() + self.ttl)
+            self._entries[key] = entry
+            self.stats["issued"] += 1
+
+        entry.waiters += 1
+        return entry
+
+    def claim(self, key: str) -> Optional[asyncio.Task]:
+        """Use a running or finished prefetch for a normal request"""
+        self._prune()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        task = entry.task
+        if task.done() and (task.cancelled() or task.exception() is not None):
+            # Let the real request retry instead of returning a failed prefetch
+            del self._entries[key]
+            self.stats["failed"] += 1
+            return None
+
+        # Kept in the store so other tabs can claim it too; a claimed task is never cancelled
+        entry.used = True
+        entry.expires = time.monotonic() + self.ttl
+        self.stats["claimed"] += 1
+        return task
+
+    async def wait(self, key: str, entry: Prefetch, http_request: Request) -> str:
+        """Await a prefetch for one low-priority request.
+
+        Only the last waiting client disconnecting cancels the task, and only
+        while it is still running and unclaimed. A finished result is kept for
+        later claims.
+        """
+        try:
+            while True:
+                done, _ = await asyncio.wait({entry.task}, timeout=DISCONNECT_POLL_INTERVAL)
+                if done:
+                    break
+                if await http_request.is_disconnected():
+                    if entry.waiters == 1 and not entry.used and not entry.task.done() and self._entries.get(key) is entry:
+                        self._drop(key)
+                    raise HTTPException(status_code=499, detail="Prefetch cancelled by client")
+        finally:
+            entry.waiters -= 1
+
+        task = entry.task
+        if task.cancelled():
+            raise HTTPException(status_code=503, detail="Prefetch was cancelled")
+
+        if task.exception() is not None:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+                self.stats["failed"] += 1
+        else:
+            # Keep the result ready for the real click for `ttl` seconds from now
+            entry.used = True
+            entry.expires = time.monotonic() + self.ttl
+            self.stats["delivered"] += 1
+        return task.result()
+
+
+prefetch_store = PrefetchStore(
+    ttl=PREFETCH_TTL,
+    max_concurrent=PREFETCH_MAX_CONCURRENT,
+    max_entries=PREFETCH_MAX_ENTRIES,
+)
@@ -2,7 +2,8 @@ import json
 from fastapi import APIRouter, HTTPException
 from models import GrammarCheckRequest, GrammarCheckResponse, Suggestion
 from prompts import PROMPTS
-from config import get_ai_model
+from config import get_ai_model, FAST_SERIALIZATION
+from serialization import build_response
 
 router = APIRouter()
 
@@ -40,7 +41,8 @@ async def check_grammar(request: GrammarCheckRequest):
             
             result = json.loads(response_text)
             
-            # Convert to our response model
+            # Convert to our response model - each suggestion from the AI model is
+            # validated here once, so the outer response can be built as trusted
             suggestions = []
             for suggestion in result.get("suggestions", []):
                 suggestions.append(Suggestion(
@@ -50,17 +52,17 @@ async def check_grammar(request: GrammarCheckRequest):
                     confidence=suggestion.get("confidence", 0.9)
                 ))
             
-            return GrammarCheckResponse(
+            return build_response(
+                GrammarCheckResponse,
+                FAST_SERIALIZATION,
                 suggestions=suggestions,
-                has_errors=result.get("has_errors", False)
+                has_errors=bool(suggestions)
             )
             
         except json.JSONDecodeError:
-            # Fallback if JSON parsing fails
-            return GrammarCheckResponse(
-                suggestions=[],
-                has_errors=False
-            )
+            # Report unparseable model output as an error rather than "no errors found",
+            # so clients (and the extension's result cache) retry instead of trusting it
+            raise HTTPException(status_code=502, detail="Could not parse AI model response")
     
     except HTTPException:
         raise
@@ -1,13 +1,28 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+from fastapi import APIRouter, HTTPException, Request
 from models import TextInsightRequest, TextInsightResponse
 from prompts import PROMPTS
-from config import get_ai_model
+from config import get_ai_model, FAST_SERIALIZATION
+from serialization import build_response
+from prefetch import prefetch_key, prefetch_store
 
 router = APIRouter()
 
 
+async def generate_insight(prompt: str) -> str:
+    """Run the AI model without blocking the event loop, so prefetches can be cancelled"""
+    model = get_ai_model()
+    response = await model.generate_content_async(prompt)
+
+    print(f"Text Insights response: {response.text[:200]}...")
+    
+    if not response.text:
+        raise HTTPException(status_code=500, detail="Failed to get response from AI model")
+    return response.text.strip()
+
+
 @router.post("/text-insights", response_model=TextInsightResponse)
-async def get_text_insights(request: TextInsightRequest):
+async def get_text_insights(request: TextInsightRequest, http_request: Request):
     """Smart Text Assistant - Explain, Summarize, or Custom actions on selected text"""
     try:
         if not request.text.strip():
@@ -18,6 +33,9 @@ async def get_text_insights(request: TextInsightRequest):
         if request.action not in valid_actions:
             raise HTTPException(status_code=400, detail=f"Invalid action. Must be one of: {valid_actions}")
         
+        if request.priority not in ("normal", "low"):
+            raise HTTPException(status_code=400, detail="Invalid priority. Must be 'normal' or 'low'")
+        
         # For custom action, custom_prompt is required
         if request.action == "custom" and not request.custom_prompt:
             raise HTTPException(status_code=400, detail="custom_prompt is required when action is 'custom'")
@@ -33,25 +51,40 @@ async def get_text_insights(request: TextInsightRequest):
         else:
             prompt = prompt_template.format(text=request.text)
 
-        print(f"Text Insights request - Action: {request.action}, Text: {request.text[:100]}...")
+        print(f"Text Insights request - Action: {request.action}, Priority: {request.priority}, Text: {request.text[:100]}...")
         
-        # Get AI model and call API
-        model = get_ai_model()
-        response = model.generate_content(prompt)
-
-        print(f"Text Insights response: {response.text[:200]}...")
-        
-        if not response.text:
-            raise HTTPException(status_code=500, detail="Failed to get response from AI model")
+        key = prefetch_key(request.action, request.text, request.custom_prompt)
+        if request.priority == "low":
+            # Speculative prefetch - kept in the store for the real request to claim
+            prefetch = prefetch_store.start(key, lambda: generate_insight(prompt))
+            if prefetch is None:
+                raise HTTPException(status_code=429, detail="Prefetch capacity exceeded")
+            result = await prefetch_store.wait(key, prefetch, http_request)
+        else:
+            task = prefetch_store.claim(key)
+            if task:
+                # Shielded so this request going away can't cancel a generation others may share
+                result = await asyncio.shield(task)
+            else:
+                with prefetch_store.normal_generation():
+                    result = await generate_insight(prompt)
         
-        return TextInsightResponse(
-            original_text=request.text,
+        return build_response(
+            TextInsightResponse,
+            FAST_SERIALIZATION,
+            original_text=request.text if request.echo_text else None,
             action=request.action,
-            result=response.text.strip(),
+            result=result,
             custom_prompt=request.custom_prompt if request.action == "custom" else None
         )
     
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing text insights request: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error processing text insights request: {str(e)}")
+
+
+@router.get("/text-insights/prefetch-stats")
+async def get_prefetch_stats():
+    """Counters for speculative prefetches, used to tune the hit rate against upstream cost"""
+    return prefetch_store.stats
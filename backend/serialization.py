@@ -0,0 +1,32 @@
+from fastapi import Response
+
+from fastapi.middleware.gzip import GZipMiddleware
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:  # brotli is optional - only needed for COMPRESSION=br
+    BrotliMiddleware = None
+
+
+def build_response(model_cls, fast: bool, **fields):
+    """Build a response model from fields the route has already checked.
+
+    In fast mode the model is constructed without validation and serialized
+    straight to JSON bytes by pydantic-core, and the ready-made response makes
+    FastAPI skip the second validation pass from `response_model`.
+    """
+    if not fast:
+        return model_cls(**fields)
+    body = model_cls.model_construct(**fields).model_dump_json()
+    return Response(content=body, media_type="application/json")
+
+
+def add_compression(app, mode: str, minimum_size: int):
+    """Compress large responses with gzip or brotli; does nothing when mode is off"""
+    if mode == "gzip":
+        app.add_middleware(GZipMiddleware, minimum_size=minimum_size)
+    elif mode == "br":
+        if BrotliMiddleware is None:
+            raise ValueError("COMPRESSION=br requires the brotli-asgi package")
+        # brotli-asgi falls back to gzip for clients that don't accept br
+        app.add_middleware(BrotliMiddleware, minimum_size=minimum_size)
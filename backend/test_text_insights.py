@@ -7,6 +7,7 @@ This script tests the refactored, clean backend code structure.
 
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:8000"
 
@@ -102,6 +103,116 @@ def test_custom_action():
     
     print("-" * 80)
 
+def test_echo_text_disabled():
+    """Test that echo_text=false leaves the original text out of the response"""
+    print("🔇 Testing echo_text=false...")
+    
+    payload = {
+        "text": "Photosynthesis converts light energy into chemical energy stored in glucose.",
+        "action": "explain",
+        "echo_text": False
+    }
+    
+    try:
+        response = requests.post(f"{BASE_URL}/text-insights", json=payload)
+        if response.status_code == 200:
+            result = response.json()
+            if result["original_text"] is None and result["result"]:
+                print("✅ Success! original_text omitted, result returned")
+            else:
+                print(f"❌ Unexpected response: original_text={result['original_text']!r}")
+        else:
+            print(f"❌ Error: {response.status_code} - {response.text}")
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Request failed: {e}")
+    
+    print("-" * 80)
+
+def get_prefetch_stats():
+    response = requests.get(f"{BASE_URL}/text-insights/prefetch-stats")
+    response.raise_for_status()
+    return response.json()
+
+def test_prefetch_stats():
+    """Test that the prefetch stats endpoint reports every counter"""
+    print("📈 Testing PREFETCH stats...")
+    
+    expected = {"issued", "delivered", "claimed", "cancelled", "rejected", "failed", "expired"}
+    try:
+        stats = get_prefetch_stats()
+        missing = expected - set(stats)
+        if missing:
+            print(f"❌ Missing counters: {sorted(missing)}")
+        elif not all(isinstance(stats[name], int) and stats[name] >= 0 for name in expected):
+            print(f"❌ Counters must be non-negative integers: {stats}")
+        else:
+            print(f"✅ Success! Stats: {stats}")
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Request failed: {e}")
+    
+    print("-" * 80)
+
+def test_prefetch_claimed_by_normal_request():
+    """Test that a normal request is served from a finished prefetch for the same text"""
+    print("⚡ Testing PREFETCH claimed by a normal request...")
+    
+    payload = {
+        "text": "Entropy is a measure of the number of microscopic configurations of a system.",
+        "action": "explain",
+        "echo_text": False
+    }
+    
+    try:
+        before = get_prefetch_stats()
+        # The prefetch has finished when its response arrives, and the result stays claimable
+        prefetch_response = requests.post(f"{BASE_URL}/text-insights", json={**payload, "priority": "low"})
+        response = requests.post(f"{BASE_URL}/text-insights", json=payload)
+        after = get_prefetch_stats()
+        
+        issued = after["issued"] - before["issued"]
+        delivered = after["delivered"] - before["delivered"]
+        claimed = after["claimed"] - before["claimed"]
+        if response.status_code != 200 or prefetch_response.status_code != 200:
+            print(f"❌ Error: normal={response.status_code}, prefetch={prefetch_response.status_code}")
+        elif (issued, delivered, claimed) != (1, 1, 1):
+            print(f"❌ Expected one generation delivered and claimed once, got "
+                  f"issued +{issued}, delivered +{delivered}, claimed +{claimed}")
+        elif response.json()["result"] != prefetch_response.json()["result"]:
+            print("❌ Normal request did not reuse the prefetched result")
+        else:
+            print("✅ Success! One generation served both requests")
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Request failed: {e}")
+    
+    print("-" * 80)
+
+def test_prefetch_capacity():
+    """Test that low-priority requests beyond PREFETCH_MAX_CONCURRENT are rejected with 429"""
+    print("🚦 Testing PREFETCH capacity limit...")
+    
+    payloads = [
+        {"text": f"Prefetch capacity test sentence number {i} about compilers.", "action": "explain",
+         "echo_text": False, "priority": "low"}
+        for i in range(5)
+    ]
+    
+    try:
+        before = get_prefetch_stats()
+        with ThreadPoolExecutor(max_workers=len(payloads)) as executor:
+            responses = list(executor.map(lambda p: requests.post(f"{BASE_URL}/text-insights", json=p), payloads))
+        after = get_prefetch_stats()
+        
+        statuses = [response.status_code for response in responses]
+        if 429 in statuses and set(statuses) <= {200, 429}:
+            print(f"✅ Success! Statuses: {statuses}")
+            print(f"Rejected: +{after['rejected'] - before['rejected']}")
+        else:
+            print(f"❌ Expected some 429s (capacity {len(payloads)} > PREFETCH_MAX_CONCURRENT), got: {statuses}")
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Request failed: {e}")
+    
+    print("-" * 80)
+
 def test_features_endpoint():
     """Test the features endpoint to see if Smart Text Assistant is listed"""
     print("🔍 Testing FEATURES endpoint...")
@@ -150,6 +261,10 @@ def main():
     test_explain_action()
     test_summarize_action()
     test_custom_action()
+    test_echo_text_disabled()
+    test_prefetch_stats()
+    test_prefetch_claimed_by_normal_request()
+    test_prefetch_capacity()
     
     print("🎉 All tests completed!")
 
@@ -35,6 +35,18 @@ chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
             });
             return true; // Keep message channel open for async response
             
+        case 'getCacheStats':
+            sendResponse(getCacheStats());
+            break;
+            
+        case 'recordPrefetchStat':
+            recordPrefetchStat(request.stat);
+            break;
+            
+        case 'getPrefetchStats':
+            getPrefetchStats().then(sendResponse);
+            return true; // Keep message channel open for async response
+            
         case 'loadFeatures':
             loadFeatures().then(sendResponse).catch(error => {
                 sendResponse({ error: error.message });
@@ -67,10 +79,183 @@ async function checkBackendStatus() {
     }
 }
 
-// Function to proxy grammar check requests
+// Result cache shared by all tabs
+// In-memory LRU (Map insertion order) mirrored to chrome.storage.session so it
+// survives the service worker being suspended, but not the browser session
+const CACHE_CONFIG = {
+    maxEntries: 200,
+    maxBytes: 2 * 1024 * 1024, // Approximate size of cached JSON results
+    ttl: 10 * 60 * 1000, // 10 minutes
+    storageKey: 'grammarResultCache',
+    persistDelay: 1000 // Batch storage writes
+};
+
+const resultCache = new Map(); // key -> { result, size, expires }
+const inFlightRequests = new Map(); // key -> Promise of a backend result
+const cacheStats = { hits: 0, misses: 0, coalesced: 0, backendRequests: 0, lastHitMs: null };
+let cacheBytes = 0;
+let cacheLoaded = null;
+let persistTimer = null;
+
+async function getCacheKey(feature, text) {
+    const bytes = new TextEncoder().encode(`${feature}\u0000${text}`);
+    const digest = await crypto.subtle.digest('SHA-256', bytes);
+    return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+}
+
+function loadCache() {
+    if (!cacheLoaded) {
+        cacheLoaded = chrome.storage.session.get(CACHE_CONFIG.storageKey).then(stored => {
+            const now = Date.now();
+            for (const [key, entry] of stored[CACHE_CONFIG.storageKey] || []) {
+                if (entry.expires > now && !resultCache.has(key)) {
+                    resultCache.set(key, entry);
+                    cacheBytes += entry.size;
+                }
+            }
+            evictCacheEntries();
+        }).catch(error => {
+            console.warn('Background: Could not restore result cache:', error);
+        });
+    }
+    return cacheLoaded;
+}
+
+function persistCache() {
+    clearTimeout(persistTimer);
+    persistTimer = setTimeout(() => {
+        chrome.storage.session.set({ [CACHE_CONFIG.storageKey]: Array.from(resultCache) }).catch(error => {
+            console.warn('Background: Could not persist result cache:', error);
+        });
+    }, CACHE_CONFIG.persistDelay);
+}
+
+function deleteCacheEntry(key) {
+    const entry = resultCache.get(key);
+    if (entry) {
+        cacheBytes -= entry.size;
+        resultCache.delete(key);
+    }
+}
+
+function evictCacheEntries() {
+    // Oldest entries come first in the Map
+    for (const key of resultCache.keys()) {
+        if (resultCache.size <= CACHE_CONFIG.maxEntries && cacheBytes <= CACHE_CONFIG.maxBytes) break;
+        deleteCacheEntry(key);
+    }
+}
+
+function getCachedResult(key) {
+    const entry = resultCache.get(key);
+    if (!entry) return null;
+    
+    deleteCacheEntry(key);
+    if (entry.expires <= Date.now()) {
+        persistCache();
+        return null;
+    }
+    
+    // Re-insert to mark as most recently used
+    resultCache.set(key, entry);
+    cacheBytes += entry.size;
+    return entry.result;
+}
+
+function setCachedResult(key, result) {
+    const size = JSON.stringify(result).length;
+    if (size > CACHE_CONFIG.maxBytes) return;
+    
+    deleteCacheEntry(key);
+    resultCache.set(key, { result, size, expires: Date.now() + CACHE_CONFIG.ttl });
+    cacheBytes += size;
+    evictCacheEntries();
+    persistCache();
+}
+
+function getCacheStats() {
+    const lookups = cacheStats.hits + cacheStats.misses + cacheStats.coalesced;
+    return {
+        ...cacheStats,
+        entries: resultCache.size,
+        bytes: cacheBytes,
+        hitRate: lookups ? (cacheStats.hits + cacheStats.coalesced) / lookups : 0
+    };
+}
+
+// Smart Text Assistant prefetch counters from all tabs
+// Only this worker writes them: loaded once, updated in memory, persisted with a debounce
+const PREFETCH_STATS_KEY = 'smartAssistantPrefetchStats';
+let prefetchStats = null;
+let prefetchStatsTimer = null;
+
+function loadPrefetchStats() {
+    if (!prefetchStats) {
+        prefetchStats = chrome.storage.local.get(PREFETCH_STATS_KEY).then(stored => ({
+            issued: 0, hits: 0, handoffs: 0, cancelled: 0, wasted: 0, failed: 0,
+            ...stored[PREFETCH_STATS_KEY]
+        }));
+    }
+    return prefetchStats;
+}
+
+async function recordPrefetchStat(name) {
+    const totals = await loadPrefetchStats();
+    if (!(name in totals)) return;
+    totals[name]++;
+    
+    clearTimeout(prefetchStatsTimer);
+    prefetchStatsTimer = setTimeout(() => {
+        chrome.storage.local.set({ [PREFETCH_STATS_KEY]: totals });
+        console.log('Background: Prefetch stats:', totals,
+            'hit rate:', totals.issued ? ((totals.hits + totals.handoffs) / totals.issued).toFixed(2) : 'n/a');
+    }, CACHE_CONFIG.persistDelay);
+}
+
+async function getPrefetchStats() {
+    return { ...await loadPrefetchStats() };
+}
+
+// Function to check grammar, served from the cache or a shared in-flight request when possible
 async function checkGrammar(data) {
+    const startTime = performance.now();
+    const feature = data.feature || 'grammar_check';
+    const key = await getCacheKey(feature, data.text);
+    await loadCache();
+    
+    const cached = getCachedResult(key);
+    if (cached) {
+        cacheStats.hits++;
+        cacheStats.lastHitMs = performance.now() - startTime;
+        console.log(`Background: Cache hit in ${cacheStats.lastHitMs.toFixed(2)}ms`, getCacheStats());
+        return cached;
+    }
+    
+    // Another tab (or a re-focus) may already be checking the same text
+    if (inFlightRequests.has(key)) {
+        cacheStats.coalesced++;
+        console.log('Background: Joining in-flight grammar check request');
+        return inFlightRequests.get(key);
+    }
+    
+    cacheStats.misses++;
+    const request = fetchGrammarCheck({ text: data.text, feature })
+        .then(result => {
+            setCachedResult(key, result);
+            return result;
+        })
+        .finally(() => {
+            inFlightRequests.delete(key);
+        });
+    inFlightRequests.set(key, request);
+    return request;
+}
+
+// Function to proxy grammar check requests
+async function fetchGrammarCheck(data) {
     try {
         console.log('Background: Making grammar check request with data:', data);
+        cacheStats.backendRequests++;
         
         const response = await fetch('http://127.0.0.1:8000/check-grammar', {
             method: 'POST',
@@ -79,7 +264,7 @@ async function checkGrammar(data) {
             },
             body: JSON.stringify({
                 text: data.text,
-                feature: data.feature || 'grammar_check'
+                feature: data.feature
             }),
             signal: AbortSignal.timeout(30000) // 30 second timeout
         });
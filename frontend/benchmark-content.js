@@ -0,0 +1,183 @@
+#!/usr/bin/env node
+/**
+ * Headless page benchmark for content.js
+ *
+ * Loads the content script into a jsdom page and reports main-thread task
+ * time spent by the script:
+ *   - per 1k DOM mutations (nodes added to the page in bursts)
+ *   - per scroll burst (100 scroll events with overlays on screen)
+ *
+ * Run locally (jsdom is not an extension dependency):
+ *   npm install --no-save jsdom
+ *   node benchmark-content.js [path/to/content.js]
+ *
+ * Pass an older copy of content.js to compare, e.g.
+ *   git show HEAD~1:frontend/content.js > /tmp/content-old.js
+ *   node benchmark-content.js /tmp/content-old.js
+ */
+
+const fs = require('fs');
+const path = require('path');
+const { JSDOM } = require('jsdom');
+
+const LONG_TASK_MS = 50;
+const MUTATION_COUNT = 1000;
+const MUTATION_BURST = 100;
+const SCROLL_EVENTS = 100;
+const OVERLAY_COUNT = 20;
+
+const scriptPath = path.resolve(process.argv[2] || path.join(__dirname, 'content.js'));
+const source = fs.readFileSync(scriptPath, 'utf8');
+
+const tick = () => new Promise(resolve => setImmediate(resolve));
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+function createPage() {
+    const dom = new JSDOM('<!DOCTYPE html><html><body></body></html>', {
+        runScripts: 'outside-only',
+        pretendToBeVisual: true  // provides requestAnimationFrame
+    });
+    const { window } = dom;
+    const tasks = [];
+
+    // Time every callback the page runs on its own as one task
+    const timed = (callback, thisArg, args) => {
+        const start = window.performance.now();
+        try {
+            return callback.apply(thisArg, args);
+        } finally {
+            tasks.push(window.performance.now() - start);
+        }
+    };
+
+    const NativeMutationObserver = window.MutationObserver;
+    window.MutationObserver = class extends NativeMutationObserver {
+        constructor(callback) {
+            super(function (...args) { return timed(callback, this, args); });
+        }
+    };
+
+    for (const name of ['setTimeout', 'requestAnimationFrame', 'requestIdleCallback']) {
+        const native = window[name];
+        if (!native) continue;
+        window[name] = (callback, ...rest) => native.call(window, (...args) => timed(callback, null, args), ...rest);
+    }
+
+    // Wrap scroll/resize listeners, keeping removeEventListener working
+    const wrappedListeners = new WeakMap();
+    const proto = window.EventTarget.prototype;
+    const nativeAdd = proto.addEventListener;
+    const nativeRemove = proto.removeEventListener;
+    proto.addEventListener = function (type, listener, options) {
+        if ((type === 'scroll' || type === 'resize') && typeof listener === 'function') {
+            if (!wrappedListeners.has(listener)) {
+                wrappedListeners.set(listener, function (...args) { return timed(listener, this, args); });
+            }
+            listener = wrappedListeners.get(listener);
+        }
+        return nativeAdd.call(this, type, listener, options);
+    };
+    proto.removeEventListener = function (type, listener, options) {
+        return nativeRemove.call(this, type, wrappedListeners.get(listener) || listener, options);
+    };
+
+    // Minimal extension API surface used by content.js
+    window.chrome = {
+        storage: { sync: { get: (keys, callback) => callback({}) } },
+        runtime: {
+            onMessage: { addListener: () => {} },
+            sendMessage: () => {}
+        }
+    };
+
+    // content.js logs heavily; keep console I/O out of the measurements
+    window.console = { ...console, log: () => {}, warn: () => {}, info: () => {}, debug: () => {} };
+
+    window.eval(`${source}\n;window.__grammarAssistant = grammarAssistant;`);
+
+    return { window, tasks };
+}
+
+function summarize(tasks, scale) {
+    const total = tasks.reduce((sum, ms) => sum + ms, 0);
+    const longTasks = tasks.filter(ms => ms > LONG_TASK_MS);
+    return {
+        tasks: tasks.length,
+        totalMs: (total * scale).toFixed(2),
+        longestMs: (tasks.length ? Math.max(...tasks) : 0).toFixed(2),
+        longTaskMs: (longTasks.reduce((sum, ms) => sum + ms, 0) * scale).toFixed(2)
+    };
+}
+
+async function benchMutations() {
+    const { window, tasks } = createPage();
+    const { document } = window;
+    await sleep(100);
+    tasks.length = 0;
+
+    // Typical SPA churn: mostly plain markup, with an occasional text input
+    for (let added = 0; added < MUTATION_COUNT; added += MUTATION_BURST) {
+        for (let i = 0; i < MUTATION_BURST; i++) {
+            const card = document.createElement('div');
+            card.innerHTML = (added + i) % 25 === 0
+                ? '<div><p>Reply</p><textarea></textarea></div>'
+                : '<div><span>Item</span><a href="#">link</a><p>Some text</p></div>';
+            document.body.appendChild(card);
+        }
+        await tick();
+    }
+    await sleep(700);  // let batched scans (idle callback / timeout fallback) run
+
+    return summarize(tasks, 1000 / MUTATION_COUNT);
+}
+
+async function benchScroll() {
+    const { window, tasks } = createPage();
+    const { document } = window;
+    await sleep(100);
+
+    const assistant = window.__grammarAssistant;
+    const textareas = [];
+    for (let i = 0; i < OVERLAY_COUNT; i++) {
+        const textarea = document.createElement('textarea');
+        textarea.value = `This are sentence number ${i} with a error in it.`;
+        document.body.appendChild(textarea);
+        textareas.push(textarea);
+    }
+    await sleep(700);
+
+    textareas.forEach((textarea, i) => assistant.applyHighlights(textarea, [
+        { id: `s-${i}-0`, original: 'This are', suggestion: 'This is', explanation: 'Subject-verb agreement' },
+        { id: `s-${i}-1`, original: 'a error', suggestion: 'an error', explanation: 'Use "an" before a vowel sound' }
+    ]));
+    textareas[0].dispatchEvent(new window.FocusEvent('focusin', { bubbles: true }));
+    await sleep(100);
+    tasks.length = 0;
+
+    for (let i = 0; i < SCROLL_EVENTS; i++) {
+        document.dispatchEvent(new window.Event('scroll'));
+        window.dispatchEvent(new window.Event('resize'));
+        await tick();
+    }
+    await sleep(100);  // let any pending animation frame run
+
+    return summarize(tasks, 1);
+}
+
+async function main() {
+    console.log(`📊 content.js page benchmark (${path.relative(process.cwd(), scriptPath) || scriptPath})`);
+    console.log('='.repeat(80));
+
+    const mutations = await benchMutations();
+    console.log(`Per 1k mutations: total=${mutations.totalMs}ms  long-task=${mutations.longTaskMs}ms  ` +
+        `longest=${mutations.longestMs}ms  tasks=${mutations.tasks}`);
+
+    const scroll = await benchScroll();
+    console.log(`Per scroll burst (${SCROLL_EVENTS} scroll+resize, ${OVERLAY_COUNT} overlays): ` +
+        `total=${scroll.totalMs}ms  long-task=${scroll.longTaskMs}ms  longest=${scroll.longestMs}ms  tasks=${scroll.tasks}`);
+}
+
+main().catch(error => {
+    console.error(error);
+    process.exit(1);
+});
@@ -12,6 +12,23 @@ class GrammarAssistant {
         this.isPanelVisible = false;
         this.userManuallyClosed = false;  // Track if user manually closed panel
         
+        // Element monitoring and positioning state
+        this.monitoredElements = new WeakSet();  // Elements with text change listeners attached
+        this.pendingMutationNodes = new Set();  // Added nodes waiting for the next batched scan
+        this.mutationScanScheduled = false;
+        this.positionFrame = null;  // requestAnimationFrame id for the pending position update
+        this.overlays = new Map();  // element -> overlay container for input/textarea highlights
+        this.overlayStyles = new WeakMap();  // element -> cached computed style used by its overlay
+        this.offscreenElements = new WeakSet();  // Tracked elements currently outside the viewport
+        this.resizeObserver = null;
+        this.intersectionObserver = null;
+        this.assistantNodeClasses = [
+            'grammar-floating-btn',
+            'grammar-suggestion-panel',
+            'grammar-suggestion-tooltip',
+            'grammar-overlay-container'
+        ];
+        
         // Configuration
         this.config = {
             debounceDelay: 2000, // Wait 2s after typing stops (increased to reduce immediate calls)
@@ -377,11 +394,12 @@ class GrammarAssistant {
         // Listen for clicks to hide panels (use capture to catch clicks before they're stopped)
         document.addEventListener('click', (e) => this.handleGlobalClick(e), true);
         
-        // Listen for scroll to update button position
-        document.addEventListener('scroll', () => this.updateButtonPosition(), true);
+        // Listen for scroll/resize to update button and overlay positions (batched per frame)
+        document.addEventListener('scroll', () => this.schedulePositionUpdate(), { capture: true, passive: true });
+        window.addEventListener('resize', () => this.schedulePositionUpdate(), { passive: true });
         
-        // Listen for resize
-        window.addEventListener('resize', () => this.updateButtonPosition());
+        // Track size and visibility of the focused element and overlay targets
+        this.setupGeometryObservers();
         
         // Listen for settings changes
         chrome.runtime.onMessage.addListener((request, sender, sendResponse) => {
@@ -395,15 +413,17 @@ class GrammarAssistant {
         // Find all existing text inputs
         this.scanForTextInputs();
         
-        // Set up mutation observer for new elements
+        // Set up mutation observer for new elements - added nodes are only collected
+        // here and scanned in one batch once the page is idle
         const observer = new MutationObserver((mutations) => {
-            mutations.forEach((mutation) => {
-                mutation.addedNodes.forEach((node) => {
-                    if (node.nodeType === Node.ELEMENT_NODE) {
-                        this.scanForTextInputs(node);
+            for (const mutation of mutations) {
+                for (const node of mutation.addedNodes) {
+                    if (node.nodeType === Node.ELEMENT_NODE && !this.isAssistantNode(node)) {
+                        this.pendingMutationNodes.add(node);
                     }
-                });
-            });
+                }
+            }
+            this.scheduleMutationScan();
         });
 
         observer.observe(document.body, {
@@ -412,6 +432,43 @@ class GrammarAssistant {
         });
     }
 
+    scheduleMutationScan() {
+        if (this.mutationScanScheduled || this.pendingMutationNodes.size === 0) return;
+        this.mutationScanScheduled = true;
+        
+        const run = () => this.processPendingMutations();
+        if (window.requestIdleCallback) {
+            window.requestIdleCallback(run, { timeout: 500 });
+        } else {
+            setTimeout(run, 50);
+        }
+    }
+
+    processPendingMutations() {
+        this.mutationScanScheduled = false;
+        const nodes = this.pendingMutationNodes;
+        this.pendingMutationNodes = new Set();
+        
+        for (const node of nodes) {
+            // Skip nodes that were removed again, or whose ancestor is scanned in this batch anyway
+            if (!node.isConnected || this.hasPendingAncestor(node, nodes)) continue;
+            this.scanForTextInputs(node);
+        }
+    }
+
+    hasPendingAncestor(node, nodes) {
+        for (let parent = node.parentElement; parent; parent = parent.parentElement) {
+            if (nodes.has(parent)) return true;
+        }
+        return false;
+    }
+
+    isAssistantNode(node) {
+        // Our own UI (button, panel, overlays, tooltips) never contains text inputs to monitor.
+        // Exact class names only, so host pages using similar names are still scanned
+        return this.assistantNodeClasses.some(className => node.classList.contains(className));
+    }
+
     scanForTextInputs(container = document) {
         const selector = this.config.enabledElements.join(', ');
         const elements = container.querySelectorAll ? container.querySelectorAll(selector) : [];
@@ -425,9 +482,9 @@ class GrammarAssistant {
     }
 
     setupElementMonitoring(element) {
-        if (element.grammarAssistantSetup) return;
+        if (this.monitoredElements.has(element)) return;
         
-        element.grammarAssistantSetup = true;
+        this.monitoredElements.add(element);
         element.classList.add('grammar-monitored');
         
         // Skip status indicator for now to avoid issues
@@ -516,7 +573,11 @@ class GrammarAssistant {
         const element = e.target;
         if (!this.isTextInput(element)) return;
         
+        if (this.currentElement && this.currentElement !== element && !this.overlays.has(this.currentElement)) {
+            this.untrackElementGeometry(this.currentElement);
+        }
         this.currentElement = element;
+        this.trackElementGeometry(element);
         this.showFloatingButton(element);
         
         // Load existing suggestions for this element
@@ -791,12 +852,13 @@ class GrammarAssistant {
         document.body.appendChild(this.floatingButton);
     }
 
-    positionFloatingButton(element) {
+    positionFloatingButton(element, rect = null, scrollX = null, scrollY = null) {
         if (!element || !this.floatingButton) return;
         
-        const rect = element.getBoundingClientRect();
-        const scrollY = window.pageYOffset || document.documentElement.scrollTop;
-        const scrollX = window.pageXOffset || document.documentElement.scrollLeft;
+        // Callers batching layout reads pass the geometry in; otherwise read it here
+        rect = rect || element.getBoundingClientRect();
+        scrollY = scrollY ?? (window.pageYOffset || document.documentElement.scrollTop);
+        scrollX = scrollX ?? (window.pageXOffset || document.documentElement.scrollLeft);
         
         // Position at bottom-right of the input
         const left = rect.right - 38 + scrollX;
@@ -812,6 +874,67 @@ class GrammarAssistant {
         }
     }
 
+    schedulePositionUpdate() {
+        // Coalesce scroll/resize/observer notifications into one update per frame
+        if (this.positionFrame !== null) return;
+        this.positionFrame = requestAnimationFrame(() => {
+            this.positionFrame = null;
+            this.updatePositions();
+        });
+    }
+
+    updatePositions() {
+        // Read all geometry first (button target and overlays), then do every DOM write,
+        // so the browser computes layout once per frame
+        const scrollY = window.pageYOffset || document.documentElement.scrollTop;
+        const scrollX = window.pageXOffset || document.documentElement.scrollLeft;
+        
+        const buttonElement = this.currentElement && this.floatingButton &&
+            this.floatingButton.classList.contains('visible') ? this.currentElement : null;
+        const buttonRect = buttonElement ? buttonElement.getBoundingClientRect() : null;
+        const { updates, detached } = this.measureOverlays();
+        
+        detached.forEach(element => this.removeOverlayHighlights(element));
+        if (buttonElement) {
+            this.positionFloatingButton(buttonElement, buttonRect, scrollX, scrollY);
+        }
+        this.applyOverlayPositions(updates, scrollX, scrollY);
+    }
+
+    setupGeometryObservers() {
+        if (window.ResizeObserver) {
+            this.resizeObserver = new ResizeObserver((entries) => {
+                // Size changes can come from style changes too, so drop cached overlay styles
+                entries.forEach(entry => this.overlayStyles.delete(entry.target));
+                this.schedulePositionUpdate();
+            });
+        }
+        
+        if (window.IntersectionObserver) {
+            this.intersectionObserver = new IntersectionObserver((entries) => {
+                entries.forEach(entry => {
+                    if (entry.isIntersecting) {
+                        this.offscreenElements.delete(entry.target);
+                    } else {
+                        this.offscreenElements.add(entry.target);
+                    }
+                });
+                this.schedulePositionUpdate();
+            });
+        }
+    }
+
+    trackElementGeometry(element) {
+        if (this.resizeObserver) this.resizeObserver.observe(element);
+        if (this.intersectionObserver) this.intersectionObserver.observe(element);
+    }
+
+    untrackElementGeometry(element) {
+        if (this.resizeObserver) this.resizeObserver.unobserve(element);
+        if (this.intersectionObserver) this.intersectionObserver.unobserve(element);
+        this.offscreenElements.delete(element);
+    }
+
     hideFloatingButton() {
         // Don't hide button if we're currently applying a suggestion
         if (this.isApplyingSuggestion) {
@@ -1160,10 +1283,13 @@ class GrammarAssistant {
         console.log('Grammar Assistant: Element type:', element.tagName, 'contentEditable:', element.contentEditable);
         console.log('Grammar Assistant: Suggestions to highlight:', suggestions.map(s => s.original));
         
-        // Clear any existing highlights first
-        this.clearHighlights(element);
+        const usesOverlay = element.tagName === 'TEXTAREA' || element.tagName === 'INPUT';
+        const hasSuggestions = suggestions && suggestions.length > 0;
         
-        if (!suggestions || suggestions.length === 0) {
+        // Clear any existing highlights first (an existing overlay is updated in place instead)
+        this.clearHighlights(element, { keepOverlay: usesOverlay && hasSuggestions });
+        
+        if (!hasSuggestions) {
             console.log('Grammar Assistant: No suggestions to highlight');
             return;
         }
@@ -1386,7 +1512,7 @@ class GrammarAssistant {
         // Note: Tooltip hover handlers will be added after tooltip is created and positioned
     }
 
-    clearHighlights(element) {
+    clearHighlights(element, { keepOverlay = false } = {}) {
         console.log('Grammar Assistant: clearHighlights called');
         console.log('Grammar Assistant: Stack trace:', new Error().stack);
         
@@ -1423,7 +1549,7 @@ class GrammarAssistant {
             
             // Normalize the element to merge adjacent text nodes
             element.normalize();
-        } else if (element.tagName === 'TEXTAREA' || element.tagName === 'INPUT') {
+        } else if ((element.tagName === 'TEXTAREA' || element.tagName === 'INPUT') && !keepOverlay) {
             // Remove overlay highlights for input/textarea
             this.removeOverlayHighlights(element);
         }
@@ -1472,114 +1598,221 @@ class GrammarAssistant {
     }
 
     createOverlayHighlights(element, suggestions) {
-        // Remove any existing overlay highlights
-        this.removeOverlayHighlights(element);
-        
-        if (!suggestions || suggestions.length === 0) return;
+        if (!suggestions || suggestions.length === 0) {
+            this.removeOverlayHighlights(element);
+            return;
+        }
         
         const text = this.getElementText(element);
-        if (!text) return;
+        if (!text) {
+            this.removeOverlayHighlights(element);
+            return;
+        }
+        
+        let overlay = this.overlays.get(element);
+        if (!overlay || !overlay.isConnected) {
+            // Create overlay container once and reuse it for later updates
+            overlay = document.createElement('div');
+            overlay.className = 'grammar-overlay-container';
+            overlay.setAttribute('data-element-id', this.getElementId(element));
+            this.applyOverlayStyle(overlay, element);
+            
+            // Place it before it is shown; later moves happen in the batched frame update
+            const scrollY = window.pageYOffset || document.documentElement.scrollTop;
+            const scrollX = window.pageXOffset || document.documentElement.scrollLeft;
+            this.positionOverlay(overlay, element.getBoundingClientRect(), scrollX, scrollY);
+            document.body.appendChild(overlay);
+            
+            this.overlays.set(element, overlay);
+            this.trackElementGeometry(element);
+        }
         
-        // Create overlay container
-        const overlay = document.createElement('div');
-        overlay.className = 'grammar-overlay-container';
-        overlay.setAttribute('data-element-id', this.getElementId(element));
+        // Patch the overlay in place rather than rebuilding it
+        this.renderOverlaySegments(overlay, element, this.buildOverlaySegments(text, suggestions));
         
-        // Position overlay exactly over the input/textarea
-        const rect = element.getBoundingClientRect();
-        const scrollY = window.pageYOffset || document.documentElement.scrollTop;
-        const scrollX = window.pageXOffset || document.documentElement.scrollLeft;
+        // Position is applied on the next frame together with the floating button
+        this.schedulePositionUpdate();
+        
+        console.log('Grammar Assistant: Rendered overlay highlights for input element');
+    }
+    
+    getOverlayStyle(element) {
+        // getComputedStyle forces a style recalc, so read it once per element
+        let style = this.overlayStyles.get(element);
+        if (!style) {
+            const computed = window.getComputedStyle(element);
+            style = {
+                padding: computed.padding,
+                fontFamily: computed.fontFamily,
+                fontSize: computed.fontSize,
+                lineHeight: computed.lineHeight,
+                borderWidth: computed.borderWidth
+            };
+            this.overlayStyles.set(element, style);
+        }
+        return style;
+    }
+    
+    applyOverlayStyle(overlay, element) {
+        const style = this.getOverlayStyle(element);
         
+        // Overlay covers the input/textarea exactly (left/top/size are set by positionOverlay)
         overlay.style.cssText = `
             position: absolute;
-            left: ${rect.left + scrollX}px;
-            top: ${rect.top + scrollY}px;
-            width: ${rect.width}px;
-            height: ${rect.height}px;
+            left: 0;
+            top: 0;
             pointer-events: none;
             z-index: 1000;
-            padding: ${window.getComputedStyle(element).padding};
-            font-family: ${window.getComputedStyle(element).fontFamily};
-            font-size: ${window.getComputedStyle(element).fontSize};
-            line-height: ${window.getComputedStyle(element).lineHeight};
-            border: ${window.getComputedStyle(element).borderWidth} solid transparent;
+            padding: ${style.padding};
+            font-family: ${style.fontFamily};
+            font-size: ${style.fontSize};
+            line-height: ${style.lineHeight};
+            border: ${style.borderWidth} solid transparent;
             box-sizing: border-box;
             overflow: hidden;
             white-space: pre-wrap;
             word-wrap: break-word;
         `;
-        
-        // Create highlighted text
-        let highlightedText = text;
-        
-        // Sort suggestions by position to avoid conflicts
-        const sortedSuggestions = [...suggestions].sort((a, b) => {
-            const aIndex = text.toLowerCase().indexOf(a.original?.toLowerCase() || '');
-            const bIndex = text.toLowerCase().indexOf(b.original?.toLowerCase() || '');
-            return bIndex - aIndex; // Reverse order to replace from end to start
+        overlay._grammarStyle = style;
+    }
+    
+    measureOverlays() {
+        // Read-only pass; detached elements are returned for removal in the write pass
+        const updates = [];
+        const detached = [];
+        for (const [element, overlay] of this.overlays) {
+            if (!element.isConnected) {
+                detached.push(element);
+                continue;
+            }
+            if (this.offscreenElements.has(element)) {
+                updates.push({ overlay, hidden: true });
+                continue;
+            }
+            updates.push({ element, overlay, rect: element.getBoundingClientRect(), style: this.getOverlayStyle(element) });
+        }
+        return { updates, detached };
+    }
+    
+    applyOverlayPositions(updates, scrollX, scrollY) {
+        updates.forEach(({ element, overlay, rect, style, hidden }) => {
+            if (hidden) {
+                overlay.style.display = 'none';
+                return;
+            }
+            if (overlay._grammarStyle !== style) {
+                this.applyOverlayStyle(overlay, element);
+            }
+            overlay.style.display = '';
+            this.positionOverlay(overlay, rect, scrollX, scrollY);
         });
-        
-        sortedSuggestions.forEach((suggestion) => {
-            if (suggestion.original && suggestion.original.trim()) {
-                const originalText = suggestion.original.trim();
-                const regex = new RegExp(this.escapeRegex(originalText), 'gi');
-                
-                const replacement = `<span class="grammar-overlay-highlight" 
-                    data-suggestion-id="${suggestion.id}" 
-                    data-original="${originalText}" 
-                    data-suggestion="${suggestion.suggestion}" 
-                    data-explanation="${suggestion.explanation}"
-                    style="background: rgba(255, 215, 0, 0.3); border-bottom: 2px solid #FFD700; cursor: pointer; pointer-events: auto;">${originalText}</span>`;
-                
-                highlightedText = highlightedText.replace(regex, replacement);
+    }
+    
+    positionOverlay(overlay, rect, scrollX, scrollY) {
+        overlay.style.left = `${rect.left + scrollX}px`;
+        overlay.style.top = `${rect.top + scrollY}px`;
+        overlay.style.width = `${rect.width}px`;
+        overlay.style.height = `${rect.height}px`;
+    }
+    
+    buildOverlaySegments(text, suggestions) {
+        // Split the text into plain and highlighted runs, earliest match first
+        const matches = [];
+        suggestions.forEach(suggestion => {
+            const originalText = (suggestion.original || '').trim();
+            if (!originalText) return;
+            
+            const regex = new RegExp(this.escapeRegex(originalText), 'gi');
+            let match;
+            while ((match = regex.exec(text)) !== null) {
+                matches.push({ start: match.index, end: match.index + match[0].length, suggestion, originalText });
             }
         });
+        matches.sort((a, b) => a.start - b.start || b.end - a.end);
         
-        overlay.innerHTML = highlightedText;
-        document.body.appendChild(overlay);
-        
-        // Add hover handlers to overlay highlights
-        const overlayHighlights = overlay.querySelectorAll('.grammar-overlay-highlight');
-        overlayHighlights.forEach(highlight => {
-            this.setupHighlightHover(highlight, element);
+        const segments = [];
+        let position = 0;
+        matches.forEach(match => {
+            if (match.start < position) return; // Overlaps an earlier highlight
+            if (match.start > position) {
+                segments.push({ text: text.slice(position, match.start) });
+            }
+            segments.push({ text: text.slice(match.start, match.end), suggestion: match.suggestion, originalText: match.originalText });
+            position = match.end;
+        });
+        if (position < text.length) {
+            segments.push({ text: text.slice(position) });
+        }
+        return segments;
+    }
+    
+    renderOverlaySegments(overlay, element, segments) {
+        // Existing highlight spans are reused when their text and suggestion are unchanged,
+        // so only the text between them and new/changed spans touch the DOM
+        const reusableSpans = new Map();
+        const reusableTextNodes = [];
+        overlay.childNodes.forEach(node => {
+            if (node.nodeType === Node.TEXT_NODE) {
+                reusableTextNodes.push(node);
+            } else if (node._grammarKey !== undefined) {
+                if (!reusableSpans.has(node._grammarKey)) reusableSpans.set(node._grammarKey, []);
+                reusableSpans.get(node._grammarKey).push(node);
+            }
         });
         
-        // Update overlay position on scroll/resize
-        const updateOverlayPosition = () => {
-            const newRect = element.getBoundingClientRect();
-            const newScrollY = window.pageYOffset || document.documentElement.scrollTop;
-            const newScrollX = window.pageXOffset || document.documentElement.scrollLeft;
-            
-            overlay.style.left = `${newRect.left + newScrollX}px`;
-            overlay.style.top = `${newRect.top + newScrollY}px`;
-            overlay.style.width = `${newRect.width}px`;
-            overlay.style.height = `${newRect.height}px`;
-        };
-        
-        // Store update function for cleanup
-        element._overlayUpdateHandler = updateOverlayPosition;
-        
-        // Listen for scroll and resize events
-        window.addEventListener('scroll', updateOverlayPosition, true);
-        window.addEventListener('resize', updateOverlayPosition);
+        const nodes = segments.map(segment => {
+            if (!segment.suggestion) {
+                const textNode = reusableTextNodes.shift() || document.createTextNode('');
+                if (textNode.nodeValue !== segment.text) textNode.nodeValue = segment.text;
+                return textNode;
+            }
+            
+            const { suggestion } = segment;
+            const key = [segment.text, suggestion.suggestion, suggestion.explanation].join('\u0001');
+            let highlight = reusableSpans.get(key)?.shift();
+            if (!highlight) {
+                highlight = document.createElement('span');
+                highlight.className = 'grammar-overlay-highlight';
+                highlight.dataset.original = segment.originalText;
+                highlight.dataset.suggestion = suggestion.suggestion;
+                highlight.dataset.explanation = suggestion.explanation;
+                highlight.style.cssText = 'background: rgba(255, 215, 0, 0.3); border-bottom: 2px solid #FFD700; cursor: pointer; pointer-events: auto;';
+                highlight.textContent = segment.text;
+                highlight._grammarKey = key;
+                this.setupHighlightHover(highlight, element);
+            }
+            // Ids change with every analysis even when the suggestion is the same
+            if (highlight.dataset.suggestionId !== String(suggestion.id)) {
+                highlight.dataset.suggestionId = suggestion.id;
+            }
+            return highlight;
+        });
         
-        console.log('Grammar Assistant: Created overlay highlights for input element');
+        // Put nodes in order, moving only those that are out of place, then drop leftovers
+        let cursor = overlay.firstChild;
+        nodes.forEach(node => {
+            if (node === cursor) {
+                cursor = cursor.nextSibling;
+            } else {
+                overlay.insertBefore(node, cursor);
+            }
+        });
+        while (cursor) {
+            const next = cursor.nextSibling;
+            overlay.removeChild(cursor);
+            cursor = next;
+        }
     }
     
     removeOverlayHighlights(element) {
-        const elementId = this.getElementId(element);
-        const existingOverlay = document.querySelector(`[data-element-id="${elementId}"]`);
+        const overlay = this.overlays.get(element);
+        if (!overlay) return;
         
-        if (existingOverlay) {
-            // Remove event listeners
-            if (element._overlayUpdateHandler) {
-                window.removeEventListener('scroll', element._overlayUpdateHandler, true);
-                window.removeEventListener('resize', element._overlayUpdateHandler);
-                delete element._overlayUpdateHandler;
-            }
-            
-            existingOverlay.remove();
+        this.overlays.delete(element);
+        if (element !== this.currentElement) {
+            this.untrackElementGeometry(element);
         }
+        overlay.remove();
     }
 
     updateSuggestionPanelContent(element, suggestions) {
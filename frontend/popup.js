@@ -31,6 +31,7 @@ function setupEventListeners() {
     // Settings checkboxes
     const autoCheckbox = document.getElementById('autoCheck');
     const toastCheckbox = document.getElementById('showToasts');
+    const prefetchCheckbox = document.getElementById('speculativePrefetch');
     
     autoCheckbox?.addEventListener('change', (e) => {
         saveSettings({ autoCheck: e.target.checked });
@@ -39,6 +40,10 @@ function setupEventListeners() {
     toastCheckbox?.addEventListener('change', (e) => {
         saveSettings({ showToasts: e.target.checked });
     });
+    
+    prefetchCheckbox?.addEventListener('change', (e) => {
+        saveSettings({ speculativePrefetch: e.target.checked });
+    });
 }
 
 async function checkBackendStatus() {
@@ -93,9 +98,10 @@ function updateFeaturesDisplay(features) {
 }
 
 function loadSettings() {
-    chrome.storage.sync.get(['autoCheck', 'showToasts'], (result) => {
+    chrome.storage.sync.get(['autoCheck', 'showToasts', 'speculativePrefetch'], (result) => {
         const autoCheck = document.getElementById('autoCheck');
         const showToasts = document.getElementById('showToasts');
+        const speculativePrefetch = document.getElementById('speculativePrefetch');
         
         if (autoCheck) {
             autoCheck.checked = result.autoCheck !== false; // Default to true
@@ -104,6 +110,10 @@ function loadSettings() {
         if (showToasts) {
             showToasts.checked = result.showToasts !== false; // Default to true
         }
+        
+        if (speculativePrefetch) {
+            speculativePrefetch.checked = result.speculativePrefetch === true; // Opt-in, default to false
+        }
     });
 }
 
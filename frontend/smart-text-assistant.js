@@ -9,6 +9,16 @@ class SmartTextAssistant {
         this.menuRestorationTime = 0; // Track when menu was restored
         this.showingResult = false; // Track if we're showing a result/content
         
+        // Speculative prefetch (opt-in): start the most likely action as soon as the menu appears
+        this.settings = { speculativePrefetch: false };
+        this.prefetch = null; // { action, text, controller, promise, settled, failed }
+        this.actionHistory = { short: {}, long: {} }; // Length bucket -> action -> times chosen
+        this.prefetchConfig = {
+            longSelectionLength: 300, // Selections at least this long use the "long" history bucket
+            defaultActions: { short: 'explain', long: 'summarize' },
+            historyKey: 'smartAssistantActionHistory'
+        };
+        
         this.init();
     }
     
@@ -24,6 +34,30 @@ class SmartTextAssistant {
     init() {
         console.log('Smart Text Assistant: Initializing...');
         this.setupSelectionListeners();
+        this.loadSettings();
+    }
+
+    loadSettings() {
+        chrome.storage.sync.get(['speculativePrefetch'], (result) => {
+            this.settings.speculativePrefetch = result.speculativePrefetch === true;
+        });
+        
+        chrome.storage.local.get([this.prefetchConfig.historyKey], (result) => {
+            this.actionHistory = result[this.prefetchConfig.historyKey] || this.actionHistory;
+        });
+        
+        // Storage changes reach every tab, not just the one the popup messages
+        chrome.storage.onChanged.addListener((changes, areaName) => {
+            if (areaName === 'sync' && changes.speculativePrefetch) {
+                this.settings.speculativePrefetch = changes.speculativePrefetch.newValue === true;
+                if (!this.settings.speculativePrefetch) {
+                    this.discardPrefetch();
+                }
+            }
+            if (areaName === 'local' && changes[this.prefetchConfig.historyKey]?.newValue) {
+                this.actionHistory = changes[this.prefetchConfig.historyKey].newValue;
+            }
+        });
     }
 
     setupSelectionListeners() {
@@ -155,6 +189,8 @@ class SmartTextAssistant {
         setTimeout(() => {
             popup.classList.add('gb-visible');
         }, 10);
+        
+        this.startPrefetch();
     }
 
     createSelectionPopup() {
@@ -343,6 +379,8 @@ class SmartTextAssistant {
     async handleAction(action, popup) {
         if (this.isProcessing) return;
         
+        this.recordActionChoice(action);
+        
         if (action === 'custom') {
             this.showCustomPromptInput(popup);
             return;
@@ -352,7 +390,8 @@ class SmartTextAssistant {
         this.showLoadingState(popup, action);
 
         try {
-            const result = await this.callTextInsightsAPI(action);
+            // Use the speculative result if it was for this action, otherwise ask now
+            const result = await this.usePrefetch(action) ?? await this.callTextInsightsAPI(action);
             this.showResult(popup, action, result);
         } catch (error) {
             this.showError(popup, error.message);
@@ -648,10 +687,12 @@ Examples:
         });
     }
 
-    async callTextInsightsAPI(action, customPrompt = null) {
+    async callTextInsightsAPI(action, customPrompt = null, { priority = 'normal', signal } = {}) {
         const payload = {
             text: this.currentSelection.text,
-            action: action
+            action: action,
+            echo_text: false, // We only read `result`, so don't send the selection back
+            priority: priority
         };
 
         if (customPrompt) {
@@ -663,7 +704,8 @@ Examples:
             headers: {
                 'Content-Type': 'application/json',
             },
-            body: JSON.stringify(payload)
+            body: JSON.stringify(payload),
+            signal: signal
         });
 
         if (!response.ok) {
@@ -675,6 +717,101 @@ Examples:
         return data.result;
     }
 
+    // Speculative prefetch
+    predictAction(text) {
+        const bucket = text.length >= this.prefetchConfig.longSelectionLength ? 'long' : 'short';
+        const counts = this.actionHistory[bucket] || {};
+        const defaultAction = this.prefetchConfig.defaultActions[bucket];
+        
+        // Custom prompts can't be predicted, so only explain/summarize are candidates
+        return ['explain', 'summarize'].reduce((best, action) => {
+            return (counts[action] || 0) > (counts[best] || 0) ? action : best;
+        }, defaultAction);
+    }
+
+    recordActionChoice(action) {
+        if (!this.currentSelection) return;
+        
+        const bucket = this.currentSelection.text.length >= this.prefetchConfig.longSelectionLength ? 'long' : 'short';
+        const counts = this.actionHistory[bucket] = this.actionHistory[bucket] || {};
+        counts[action] = (counts[action] || 0) + 1;
+        chrome.storage.local.set({ [this.prefetchConfig.historyKey]: this.actionHistory });
+    }
+
+    startPrefetch() {
+        if (!this.settings.speculativePrefetch || !this.currentSelection) return;
+        
+        this.discardPrefetch();
+        
+        const text = this.currentSelection.text;
+        const action = this.predictAction(text);
+        const controller = new AbortController();
+        const prefetch = { action, text, controller, settled: false, failed: false };
+        
+        prefetch.promise = this.callTextInsightsAPI(action, null, { priority: 'low', signal: controller.signal });
+        prefetch.promise
+            .catch(error => {
+                // Aborts are counted as cancelled by discardPrefetch
+                if (error.name !== 'AbortError') {
+                    prefetch.failed = true;
+                    this.recordPrefetchStat('failed');
+                    console.log('🧠 Prefetch failed:', error.message);
+                }
+            })
+            .finally(() => { prefetch.settled = true; });
+        
+        this.prefetch = prefetch;
+        this.recordPrefetchStat('issued');
+        console.log('🧠 Prefetching', action, 'for selection of', text.length, 'chars');
+    }
+
+    async usePrefetch(action) {
+        // Returns the finished prefetched result, or null when the caller should request it now
+        const prefetch = this.prefetch;
+        if (!prefetch) return null;
+        
+        if (prefetch.action !== action || !this.currentSelection || prefetch.text !== this.currentSelection.text) {
+            this.discardPrefetch();
+            return null;
+        }
+        
+        this.prefetch = null;
+        if (!prefetch.settled) {
+            // Still generating: send the real request, which the backend serves from the
+            // running prefetch. The prefetch request is left to finish rather than aborted,
+            // so the generation isn't cancelled before the real request claims it.
+            this.recordPrefetchStat('handoffs');
+            return null;
+        }
+        
+        try {
+            const result = await prefetch.promise;
+            this.recordPrefetchStat('hits');
+            return result;
+        } catch (error) {
+            return null; // Already counted as failed
+        }
+    }
+
+    discardPrefetch() {
+        const prefetch = this.prefetch;
+        if (!prefetch) return;
+        this.prefetch = null;
+        
+        if (!prefetch.settled) {
+            prefetch.controller.abort();
+            this.recordPrefetchStat('cancelled');
+        } else if (!prefetch.failed) {
+            // Generated but never shown - the upstream cost was spent for nothing
+            this.recordPrefetchStat('wasted');
+        }
+    }
+
+    recordPrefetchStat(name) {
+        // The background worker keeps the totals, so tabs don't overwrite each other
+        chrome.runtime.sendMessage({ action: 'recordPrefetchStat', stat: name }).catch(() => {});
+    }
+
     hideSelectionPopup(clearSelection = true, force = false) {
         // Don't hide popup during processing unless forced (e.g., by close button)
         if (this.isProcessing && !force) {
@@ -690,6 +827,7 @@ Examples:
         }
         
         console.log('🧠 Hiding popup, clearSelection:', clearSelection, 'force:', force);
+        this.discardPrefetch();
         if (this.selectionPopup) {
             this.selectionPopup.classList.remove('gb-visible');
             setTimeout(() => {